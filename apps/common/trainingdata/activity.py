@@ -6,6 +6,12 @@ from garmin_fit_sdk import Decoder, Stream
 import trainingdata.gpsutils as GPSUtils
 import pandas as pd
 
+def read_fit_messages(source_file: str) -> dict:
+    stream = Stream.from_file(source_file)
+    decoder = Decoder(stream)
+    messages, errors = decoder.read()
+    return messages
+
 @dataclass
 class ActivitySummary:
     title: str = "Untitled Workout"
@@ -16,14 +22,14 @@ class ActivitySummary:
     elevation_m: float = 0.0
     avg_speed_mps: float = 0.0
 
-    def __init__(self, source_file: str) -> None:
+    def __init__(self, source_file: str, fit_messages: dict = None) -> None:
         # determine file type
         extension = os.path.splitext(source_file)[1]
 
         match extension:
             case '.fit':
                 # open a fit file
-                self.import_fit(source_file)
+                self.import_fit(source_file, fit_messages)
 
             case '.gpx':
                 # open a gpx file
@@ -34,10 +40,9 @@ class ActivitySummary:
                 # benbug raise error
                 pass
 
-    def import_fit(self, source_file: str) -> None:
-        stream = Stream.from_file(source_file)
-        decoder = Decoder(stream)
-        messages, errors = decoder.read()
+    def import_fit(self, source_file: str, messages: dict = None) -> None:
+        if messages is None:
+            messages = read_fit_messages(source_file)
 
         session_data = messages['session_mesgs'][0]
         self.start = session_data['start_time']
@@ -52,7 +57,9 @@ class ActivitySummary:
         pass
 
     def get_active_time(self) -> str:
-        return str(timedelta(seconds=self.active_duration_s)).split('.')[0]
+        minutes, seconds = divmod(int(self.active_duration_s), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02}:{seconds:02}"
 
 # benbug - where does this belong
 OPTIONAL_FIT_RECORDS = ["enhanced_altitude", "position_lat", "position_long", "enhanced_speed", "fractional_cadence", "heart_rate", "distance"]
@@ -66,7 +73,7 @@ class GPSActivityData:
     start: datetime = None
     time_series_data: pd.DataFrame = None
 
-    def __init__(self, source_file: str) -> None:
+    def __init__(self, source_file: str, fit_messages: dict = None) -> None:
         self.source_file = source_file
         self.time_series_data = pd.DataFrame()
         # determine file type
@@ -75,7 +82,7 @@ class GPSActivityData:
         match extension:
             case '.fit':
                 # open a fit file
-                self.import_fit(source_file)
+                self.import_fit(source_file, fit_messages)
 
             case '.gpx':
                 # open a gpx file
@@ -86,33 +93,30 @@ class GPSActivityData:
                 # benbug raise error
                 pass
 
-    def import_fit(self, source_file: str) -> None:
-        stream = Stream.from_file(source_file)
-        decoder = Decoder(stream)
-        messages, errors = decoder.read()
+    def import_fit(self, source_file: str, messages: dict = None) -> None:
+        if messages is None:
+            messages = read_fit_messages(source_file)
 
+        series_rows = []
         for rec in messages["record_mesgs"]:
             # for each key that exists in record and is in OPTIONAL_FIT_RECORDS
             # add it to a dictionary
-            series_row = {}
-            series_row.update({"timestamp":rec["timestamp"]})
+            series_row = {"timestamp":rec["timestamp"]}
 
-            rec_keys = rec.keys()
+            for key in OPTIONAL_FIT_RECORDS:
+                if key in rec:
+                    series_row[key] = rec[key]
 
-            data_keys = [k for k in OPTIONAL_FIT_RECORDS if k in rec.keys()]
+            series_rows.append(series_row)
 
-            for key in data_keys:
-                series_row.update({key:[rec[key]]})
-
-            # turn the dictionary into a dataframe and append it to the existing data
-            self.time_series_data = pd.concat([self.time_series_data,
-                                               pd.DataFrame.from_dict(series_row)],
-                                              ignore_index=True)
+        # build the dataframe once, concatenating per record is quadratic
+        self.time_series_data = pd.DataFrame(series_rows)
 
         # Global transformations post parsing
         # conversion from semicircles to degrees
-        self.time_series_data["position_lat"] = self.time_series_data["position_lat"].apply(GPSUtils.semicircles_to_degrees)
-        self.time_series_data["position_long"] = self.time_series_data["position_long"].apply(GPSUtils.semicircles_to_degrees)
+        # (applied to whole columns so numpy does it in one pass)
+        self.time_series_data["position_lat"] = GPSUtils.semicircles_to_degrees(self.time_series_data["position_lat"])
+        self.time_series_data["position_long"] = GPSUtils.semicircles_to_degrees(self.time_series_data["position_long"])
 
         # benbug - parse summary information
         session_data = messages["session_mesgs"][0]
@@ -130,7 +134,14 @@ class Activity:
 
     def __init__(self, source_file: str) -> None:
         self.source_file = source_file
-        self.gps_data = GPSActivityData(self.source_file)
-        self.summary = ActivitySummary(self.source_file)
+
+        # decode a fit file once and share the messages rather than having
+        # the gps data and the summary each read the whole file
+        fit_messages = None
+        if os.path.splitext(source_file)[1] == '.fit':
+            fit_messages = read_fit_messages(source_file)
+
+        self.gps_data = GPSActivityData(self.source_file, fit_messages)
+        self.summary = ActivitySummary(self.source_file, fit_messages)
 
         # benbug - get the summary information
@@ -1,3 +1,4 @@
+import os
 from flask import Flask
 from views import views
 
@@ -9,6 +10,7 @@ app.jinja_env.auto_reload = True
 app.config['TEMPLATES_AUTO_RELOAD'] = True
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['ALLOWED_EXTENSIONS'] = ALLOWED_EXTENSIONS
+os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 app.register_blueprint(views, url_prefix="/")
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from flask import (
     flash,
 )
 from werkzeug.utils import secure_filename
+from functools import lru_cache
 import os
 from trainingdata.activity import Activity
 
@@ -23,6 +24,13 @@ def allowed_file(filename):
     )
 
 
+@lru_cache(maxsize=8)
+def load_activity(path, mtime_ns):
+    # the modification time is part of the key so re-uploading a file with
+    # the same name parses it again
+    return Activity(path)
+
+
 @views.route("/")
 @views.route("/dashboard")
 def dashboard():
@@ -75,7 +83,8 @@ def activity_view():
 def import_summary():
     args = request.args
     file_name = args.get("file_name")
-    activity = Activity(os.path.join(current_app.config["UPLOAD_FOLDER"], file_name))
+    path = os.path.join(current_app.config["UPLOAD_FOLDER"], file_name)
+    activity = load_activity(path, os.stat(path).st_mtime_ns)
     return render_template("import_summary.html", activity=activity)
 
 